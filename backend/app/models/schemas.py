@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
+from datetime import date
 
 class ChannelMetrics(BaseModel):
     name: str
@@ -51,6 +52,18 @@ class SimulationResult(BaseModel):
     blended_roas: float
     optimization_score: int
 
+class SimulationRequest(BaseModel):
+    model_id: Optional[str] = None  # Fitted upload, or...
+    scenario: Optional[str] = None  # ...a sample scenario ("high", "mid", "low")
+    budgets: Dict[str, float]  # Channel name -> spend; omitted channels keep current spend
+
+class SimulatorUpdate(BaseModel):
+    seq: Optional[Any] = None  # Last client `seq` folded into this update
+    budgets: Dict[str, float]
+    result: SimulationResult
+    marginal_roas: Dict[str, float]
+    compute_ms: float
+
 class MMMResult(BaseModel):
     # Original fields (for backward compatibility)
     roi: Dict[str, float]
@@ -68,8 +81,85 @@ class MMMResult(BaseModel):
     weekly_data: List[Dict[str, Any]]  # 52 weeks of actual vs predicted
     total_budget: float
     scenario_quality: str  # "high", "mid", "low"
+    model_id: Optional[str] = None  # Set for fitted uploads; key for follow-up endpoints
+
+class ContributionSeries(BaseModel):
+    model_id: str
+    components: List[str]  # "base", calendar terms ("trend", "seasonality", "holidays"), each control, each channel
+    dates: List[str]  # Start date of each (possibly downsampled) point
+    values: List[List[float]]  # One row per date, one column per component
+    weeks: List[int]  # Weeks summed into each point; the last may be fewer than `resolution`
+    resolution: int  # Requested weeks per point
 
 class UploadResponse(BaseModel):
     filename: str
     message: str
     status: str
+
+class ForecastRequest(BaseModel):
+    model_id: str
+    channels: List[str]  # Column order of `flighting`; omitted model channels get zero spend
+    flighting: List[List[float]]  # Future weeks x channels spend
+    start_date: Optional[date] = None  # >= a week after the last observed week (the default)
+    draws: int = Field(1000, ge=10, le=5000)
+    interval: float = Field(0.9, gt=0, lt=1)
+
+class ForecastWeek(BaseModel):
+    week: str
+    projected: float
+    lower: float
+    upper: float
+    media_contribution: float
+
+class ForecastResult(BaseModel):
+    model_id: str
+    interval: float
+    weeks: List[ForecastWeek]
+    total_projected: float
+    total_spend: float
+
+class ColumnProfile(BaseModel):
+    name: str
+    kind: str  # "date", "target", "spend", "control", "ignored" (text-only or unused target; not used by the fit)
+    dtype: str  # "date", "numeric", "text"
+    missing: int
+    invalid: int
+    negative: int
+
+class DateGap(BaseModel):
+    after: str
+    before: str
+    missing_weeks: int
+
+class ChannelSpendSummary(BaseModel):
+    channel: str
+    column: str
+    total: float
+    mean: float
+    min: float
+    max: float
+    zero_weeks: int
+
+class CollinearityWarning(BaseModel):
+    a: str
+    b: str
+    correlation: float
+
+class ValidationIssue(BaseModel):
+    severity: str  # "error", "warning"
+    message: str
+
+class ValidationReport(BaseModel):
+    upload_id: str  # Content hash; uploading the same file reuses this scan
+    filename: str
+    valid: bool
+    row_count: int
+    columns: List[ColumnProfile]
+    start_date: Optional[str]
+    end_date: Optional[str]
+    duplicate_dates: List[str]
+    date_gaps: List[DateGap]
+    spend: List[ChannelSpendSummary]
+    collinearity: List[CollinearityWarning]
+    issues: List[ValidationIssue]
+    elapsed_ms: float
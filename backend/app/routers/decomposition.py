@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException, Query
+from datetime import date
+from typing import Optional
+from app.services.store import model_store
+from app.models.schemas import ContributionSeries
+
+router = APIRouter()
+
+@router.get("/decomposition/{model_id}", response_model=ContributionSeries)
+async def get_decomposition(
+    model_id: str,
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    resolution: int = Query(1, ge=1, description="Weeks summed into each returned point"),
+):
+    """
+    Get the weekly contribution decomposition (base and each channel) of a fitted model.
+
+    Args:
+        model_id: Id returned as `model_id` by the upload endpoint
+    """
+    try:
+        model = model_store.get(model_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown model: {model_id}")
+    return ContributionSeries(model_id=model_id, **model.decomposition.query(start, end, resolution))
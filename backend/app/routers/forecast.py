@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException
+import numpy as np
+from app.services.store import model_store
+from app.services.forecast import forecast
+from app.models.schemas import ForecastRequest, ForecastResult
+
+router = APIRouter()
+
+@router.post("/forecast", response_model=ForecastResult)
+async def forecast_plan(request: ForecastRequest):
+    """
+    Project weekly sales with intervals for a future media plan.
+
+    Args:
+        request: Fitted model id plus a future weeks x channels flighting matrix
+    """
+    try:
+        model = model_store.get(request.model_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown model: {request.model_id}")
+    try:
+        result = forecast(
+            model, request.channels, np.array(request.flighting, dtype=np.float64),
+            start=request.start_date, draws=request.draws, interval=request.interval,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ForecastResult(model_id=request.model_id, **result)
@@ -0,0 +1,91 @@
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, status
+from typing import Optional
+import asyncio
+import json
+import time
+from app.services.simulator import SimulatorSession, load_curves
+from app.services.store import model_store
+from app.models.schemas import SimulationRequest, SimulatorUpdate
+
+router = APIRouter()
+
+# Window after the first pending message in which further ticks are merged
+DEBOUNCE_SECONDS = 0.005
+
+@router.post("/simulate", response_model=SimulatorUpdate)
+def simulate(request: SimulationRequest):
+    """
+    One-off budget simulation; the REST counterpart of the live simulator socket.
+    """
+    try:
+        model = model_store.get(request.model_id) if request.model_id else None
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown model: {request.model_id}")
+    try:
+        curves = load_curves(model, request.scenario)
+        started = time.perf_counter()
+        session = SimulatorSession(curves)
+        session.submit({"budgets": request.budgets})
+        update = session.update()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return SimulatorUpdate(**update, compute_ms=round((time.perf_counter() - started) * 1000, 3))
+
+@router.websocket("/ws/simulator")
+async def simulator_socket(websocket: WebSocket, model_id: Optional[str] = None, scenario: Optional[str] = None):
+    """
+    Live simulator for slider-driven what-ifs.
+
+    Connect with `?model_id=` (fitted upload) or `?scenario=` (sample data) and
+    send `{"deltas": {...}}`, `{"budgets": {...}}` or `{"reset": true}`, with an
+    optional `seq`. Bursts are coalesced; each reply reflects every message up
+    to the echoed `seq`.
+    """
+    await websocket.accept()
+    try:
+        model = model_store.get(model_id) if model_id else None
+    except KeyError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=f"Unknown model: {model_id}")
+        return
+    try:
+        session = SimulatorSession(load_curves(model, scenario))
+    except ValueError as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e))
+        return
+
+    pending = asyncio.Event()
+
+    async def receive():
+        while True:
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", status.WS_1000_NORMAL_CLOSURE))
+            if frame.get("text") is None:
+                await websocket.send_json({"error": "Messages must be JSON text frames"})
+                continue
+            try:
+                session.submit(json.loads(frame["text"]))
+            except (TypeError, ValueError, AttributeError) as e:
+                await websocket.send_json({"error": str(e)})
+                continue
+            pending.set()
+
+    receiver = asyncio.create_task(receive())
+    try:
+        pending.set()  # Send the starting state
+        while True:
+            waiter = asyncio.create_task(pending.wait())
+            done, _ = await asyncio.wait({waiter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                waiter.cancel()
+                receiver.result()  # Re-raise the disconnect
+            await asyncio.sleep(DEBOUNCE_SECONDS)
+            pending.clear()
+            started = time.perf_counter()
+            update = session.update()
+            update["compute_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            await websocket.send_json(SimulatorUpdate(**update).model_dump())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
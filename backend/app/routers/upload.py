@@ -1,8 +1,8 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from app.services.mmm import mmm_service
 from app.services.sample_data import get_sample_data
-from app.models.schemas import UploadResponse, MMMResult
-import shutil
+from app.services.validation import scan_csv
+from app.models.schemas import UploadResponse, MMMResult, ValidationReport
 import os
 
 router = APIRouter()
@@ -10,17 +10,32 @@ router = APIRouter()
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+@router.post("/validate", response_model=ValidationReport)
+def validate_file(file: UploadFile = File(...)):
+    """
+    Pre-flight an upload without fitting: column types, date gaps, spend
+    summaries and collinearity.
+    """
+    return scan_csv(file.file, file.filename).report
+
 @router.post("/upload", response_model=MMMResult)
-async def upload_file(file: UploadFile = File(...)):
+def upload_file(file: UploadFile = File(...)):
     try:
-        file_path = os.path.join(UPLOAD_DIR, file.filename)
+        file_path = os.path.join(UPLOAD_DIR, os.path.basename(file.filename))
+        # Save, hash and profile the upload in one pass; the fit reuses the parsed columns.
         with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+            scan = scan_csv(file.file, file.filename, sink=buffer)
+        if not scan.valid:
+            raise HTTPException(status_code=400, detail="; ".join(scan.errors))
             
         # Process the file immediately for this demo
-        result = mmm_service.process_data(file_path)
+        result = mmm_service.process_data(file_path, frame=scan.frame())
         return result
         
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
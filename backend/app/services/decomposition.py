@@ -0,0 +1,60 @@
+"""
+Contribution Decomposition - Per-week, per-component contributions of a fitted model
+"""
+import numpy as np
+from datetime import date
+from typing import List, Optional
+
+from app.services.model import FittedModel
+
+
+class ContributionDecomposition:
+    """Compact weeks x components float32 contribution matrix with range/downsampling queries."""
+
+    def __init__(self, dates: np.ndarray, components: List[str], values: np.ndarray):
+        self.dates = dates
+        self.components = components
+        self.values = values
+
+    def query(self, start: Optional[date] = None, end: Optional[date] = None,
+              resolution: int = 1) -> dict:
+        """
+        Slice the series to [start, end] and sum it into buckets of `resolution` weeks.
+
+        Summing keeps bucket totals equal to the underlying weekly contributions;
+        `weeks` gives each bucket's length, as the last one may be partial.
+        """
+        lo = 0 if start is None else np.searchsorted(self.dates, np.datetime64(start, "D"), side="left")
+        hi = len(self.dates) if end is None else np.searchsorted(self.dates, np.datetime64(end, "D"), side="right")
+        dates = self.dates[lo:hi]
+        values = self.values[lo:hi]
+
+        weeks = np.ones(len(dates), dtype=int)
+        if resolution > 1 and len(dates):
+            starts = np.arange(0, len(dates), resolution)
+            values = np.add.reduceat(values, starts, axis=0)
+            weeks = np.diff(np.append(starts, len(dates)))
+            dates = dates[starts]
+
+        return {
+            "components": self.components,
+            "dates": [str(d) for d in dates],
+            "values": np.round(values.astype(np.float64), 2).tolist(),
+            "weeks": weeks.tolist(),
+            "resolution": resolution,
+        }
+
+
+def decompose(model: FittedModel) -> ContributionDecomposition:
+    """Compute every component's weekly contribution in a single pass over the design matrix."""
+    components = list(dict.fromkeys(model.column_components))
+    index = {name: i for i, name in enumerate(components)}
+
+    # Fold coefficients into a columns x components grouping matrix so one
+    # matmul yields contributions already summed per component.
+    weights = np.zeros((len(model.columns), len(components)))
+    for col, component in enumerate(model.column_components):
+        weights[col, index[component]] = model.coefficients[col]
+
+    values = (model.design @ weights).astype(np.float32)
+    return ContributionDecomposition(model.dates, components, values)
@@ -0,0 +1,109 @@
+"""
+Feature Pipeline - Trend, Fourier seasonality, holiday and control basis matrices
+"""
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from typing import List, NamedTuple, Tuple
+
+WEEKS_PER_YEAR = 52.1775
+MAX_CACHED_BASES = 64
+
+
+class FeatureConfig(NamedTuple):
+    """Which calendar features to build; hashable so it can key the basis cache."""
+    trend: bool = True
+    fourier_order: int = 2
+    period_weeks: float = WEEKS_PER_YEAR
+    holidays: bool = True
+
+
+class FeatureBasis(NamedTuple):
+    matrix: np.ndarray  # rows x columns, read-only
+    columns: List[str]
+    column_components: List[str]
+
+
+_cache: "OrderedDict[tuple, FeatureBasis]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def holiday_dates(first_year: int, last_year: int) -> np.ndarray:
+    """Sorted major US retail holidays for the given years."""
+    days = []
+    for year in range(first_year, last_year + 1):
+        days += [
+            np.datetime64(f"{year}-01-01"),
+            np.busday_offset(f"{year}-06", -1, roll="forward", weekmask="Mon"),  # Memorial Day
+            np.datetime64(f"{year}-07-04"),
+            np.busday_offset(f"{year}-09", 0, roll="forward", weekmask="Mon"),   # Labor Day
+            np.busday_offset(f"{year}-11", 3, roll="forward", weekmask="Thu"),   # Thanksgiving
+            np.datetime64(f"{year}-12-25"),
+        ]
+    return np.sort(np.array(days, dtype="datetime64[D]"))
+
+
+def _build_basis(dates: np.ndarray, origin: np.datetime64, config: FeatureConfig) -> FeatureBasis:
+    columns, components, blocks = [], [], []
+
+    if config.trend:
+        blocks.append(((dates - origin) / np.timedelta64(1, "D") / 365.25)[:, None])
+        columns.append("trend")
+        components.append("trend")
+
+    if config.fourier_order > 0:
+        # Absolute time keeps the phase stable for any slice or future date range.
+        weeks = dates.astype("datetime64[D]").astype(np.float64) / 7.0
+        harmonics = np.arange(1, config.fourier_order + 1)
+        angles = 2 * np.pi * weeks[:, None] * harmonics[None, :] / config.period_weeks
+        blocks += [np.sin(angles), np.cos(angles)]
+        columns += [f"sin_{k}" for k in harmonics] + [f"cos_{k}" for k in harmonics]
+        components += ["seasonality"] * (2 * config.fourier_order)
+
+    if config.holidays and len(dates):
+        years = dates.astype("datetime64[Y]").astype(int) + 1970
+        holidays = holiday_dates(int(years.min()), int(years.max()) + 1)
+        # A week is a holiday week if any holiday falls in [start, start + 7 days).
+        in_week = np.searchsorted(holidays, dates + np.timedelta64(7, "D")) - np.searchsorted(holidays, dates)
+        blocks.append((in_week > 0).astype(np.float64)[:, None])
+        columns.append("holiday")
+        components.append("holidays")
+
+    matrix = np.hstack(blocks) if blocks else np.empty((len(dates), 0))
+    matrix.setflags(write=False)
+    return FeatureBasis(matrix, columns, components)
+
+
+def calendar_basis(dates: np.ndarray, origin: np.datetime64,
+                   config: FeatureConfig = FeatureConfig()) -> FeatureBasis:
+    """
+    Trend, Fourier and holiday columns for a weekly date index.
+
+    Bases are cached per (date index, origin, config) so repeated fits,
+    CV folds and hyperparameter candidates share one read-only matrix.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    key = (dates.tobytes(), np.datetime64(origin, "D"), config)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    basis = _build_basis(dates, np.datetime64(origin, "D"), config)
+    with _cache_lock:
+        _cache[key] = basis
+        while len(_cache) > MAX_CACHED_BASES:
+            _cache.popitem(last=False)
+    return basis
+
+
+def control_matrix(frame: pd.DataFrame, columns: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """User-supplied control columns (price, promotions, ...) as a float matrix."""
+    matrix = np.empty((len(frame), len(columns)))
+    for i, column in enumerate(columns):
+        values = pd.to_numeric(frame[column], errors="coerce")
+        if values.isna().any():
+            raise ValueError(f"Control column '{column}' has missing or non-numeric values")
+        matrix[:, i] = values.to_numpy(dtype=np.float64)
+    return matrix, list(columns)
@@ -0,0 +1,81 @@
+"""
+Forecast Service - Weekly sales projections for a future flighting plan
+"""
+import numpy as np
+from datetime import date
+from typing import List, Optional
+
+from app.services.features import calendar_basis
+from app.services.model import FittedModel, geometric_adstock, hill
+
+DEFAULT_DRAWS = 1000
+
+
+def forecast(model: FittedModel, channels: List[str], flighting: np.ndarray,
+             start: Optional[date] = None, draws: int = DEFAULT_DRAWS,
+             interval: float = 0.9, seed: int = 0) -> dict:
+    """
+    Project weekly sales for a future weeks x channels spend plan.
+
+    Adstock continues from the carry-over at the last observed week, decayed
+    over any gap before the plan starts; calendar terms come from the cached
+    basis and controls are held at their last observed values. Intervals
+    combine coefficient draws from the fit's covariance with residual noise.
+    """
+    flighting = np.asarray(flighting, dtype=np.float64)
+    if flighting.ndim != 2 or flighting.shape[1] != len(channels):
+        raise ValueError("Flighting must be a weeks x channels matrix matching `channels`")
+    if np.any(flighting < 0):
+        raise ValueError("Flighting spend must be non-negative")
+    unknown = sorted(set(channels) - set(model.channels))
+    if unknown:
+        raise ValueError(f"Unknown channels: {unknown}. Model channels: {model.channels}")
+
+    # Reorder to the model's channel order; channels left out of the plan go dark.
+    spend = np.zeros((flighting.shape[0], len(model.channels)))
+    for i, name in enumerate(channels):
+        spend[:, model.channels.index(name)] = flighting[:, i]
+
+    last = model.dates[-1]
+    first = np.datetime64(start, "D") if start else last + np.timedelta64(7, "D")
+    if first < last + np.timedelta64(7, "D"):
+        raise ValueError(f"start_date must be at least a week after the last observed week ({last})")
+    dates = first + np.arange(len(spend)) * np.timedelta64(7, "D")
+
+    # Carry-over keeps decaying through the dark weeks between the data and the plan.
+    gap_weeks = (first - last) / np.timedelta64(7, "D") - 1
+    adstocked = geometric_adstock(spend, model.decay, initial=model.last_adstock * model.decay ** gap_weeks)
+    media = hill(adstocked, model.half_saturation, model.slope)
+    basis = calendar_basis(dates, model.origin, model.feature_config)
+    design = np.hstack([
+        np.ones((len(dates), 1)),
+        basis.matrix,
+        np.broadcast_to(model.last_controls, (len(dates), len(model.controls))),
+        media,
+    ])
+
+    rng = np.random.default_rng(seed)
+    coefficients = rng.multivariate_normal(model.coefficients, model.covariance, size=draws,
+                                           method="eigh", check_valid="ignore")
+    samples = design @ coefficients.T + rng.normal(0.0, model.sigma, size=(len(dates), draws))
+
+    tail = (1.0 - interval) / 2
+    lower, upper = np.quantile(samples, [tail, 1.0 - tail], axis=1)
+    projected = design @ model.coefficients
+    media_contribution = media @ model.coefficients[-len(model.channels):]
+
+    return {
+        "interval": interval,
+        "weeks": [
+            {
+                "week": str(d),
+                "projected": round(float(p), 2),
+                "lower": round(float(lo), 2),
+                "upper": round(float(hi), 2),
+                "media_contribution": round(float(m), 2),
+            }
+            for d, p, lo, hi, m in zip(dates, projected, lower, upper, media_contribution)
+        ],
+        "total_projected": round(float(projected.sum()), 2),
+        "total_spend": round(float(spend.sum()), 2),
+    }
@@ -1,19 +1,28 @@
 import pandas as pd
 import numpy as np
+from typing import Optional
 from app.models.schemas import (
     MMMResult, ChannelMetrics, KPIs, ModelDiagnostics,
     ModelParameters, SaturationCurve, MarginalEfficiency
 )
+from app.services.model import read_frame, fit_model
+from app.services.decomposition import decompose
+from app.services.store import model_store
 
 class MMMService:
-    def process_data(self, file_path: str) -> MMMResult:
+    def process_data(self, file_path: str, frame: Optional[pd.DataFrame] = None) -> MMMResult:
         """
         Process uploaded CSV and return MMM results.
         In a real scenario, this would run Meridian MMM.
-        For demo, returns mock data based on file analysis.
+        For demo, returns mock data based on file analysis; the uploaded
+        data is fitted and decomposed, retrievable via the returned model_id.
+        Pass `frame` to reuse columns already parsed by the upload scan.
         """
-        import time
-        time.sleep(1)  # Simulate processing
+        if frame is None:
+            frame = read_frame(file_path)
+        model = fit_model(frame)
+        model.decomposition = decompose(model)
+        model_id = model_store.add(model)
         
         # Generate mock results similar to high-quality sample
         channels = [
@@ -120,7 +129,8 @@ class MMMService:
             ],
             weekly_data=weekly_data,
             total_budget=20000000,
-            scenario_quality="high"
+            scenario_quality="high",
+            model_id=model_id
         )
 
 mmm_service = MMMService()
@@ -0,0 +1,204 @@
+"""
+Model Fitting - Lightweight adstock/saturation regression fitted on uploaded data
+"""
+import numpy as np
+import pandas as pd
+from typing import List, Optional
+
+from app.services.features import FeatureConfig, calendar_basis, control_matrix
+
+DATE_COLUMN = "date"
+TARGET_COLUMNS = ("sales", "revenue")
+SPEND_MARKER = "spend"
+
+DECAY_CANDIDATES = (0.0, 0.3, 0.5, 0.7)
+DEFAULT_SLOPE = 1.0
+CV_FOLDS = 3
+MIN_CV_ROWS = 26
+MIN_SEASONAL_ROWS = 52
+
+
+def geometric_adstock(spend: np.ndarray, decay: np.ndarray,
+                      initial: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Apply geometric carry-over along the first (time) axis of a weeks x channels array.
+
+    `decay` and `initial` broadcast against the channel axis, so a draws x
+    channels decay yields a weeks x draws x channels result in one scan.
+    """
+    spend = np.asarray(spend, dtype=np.float64)
+    shape = np.broadcast_shapes(spend.shape[1:], np.shape(decay), np.shape(initial) if initial is not None else ())
+    carry = np.zeros(shape) if initial is None else np.array(np.broadcast_to(initial, shape), dtype=np.float64)
+    adstocked = np.empty((spend.shape[0],) + shape)
+    for week in range(spend.shape[0]):
+        carry *= decay
+        carry += spend[week]
+        adstocked[week] = carry
+    return adstocked
+
+
+def hill(x: np.ndarray, half_saturation: np.ndarray, slope: np.ndarray) -> np.ndarray:
+    """Hill saturation curve, matching the one drawn by the simulator."""
+    x = np.maximum(x, 0.0)
+    return x ** slope / (half_saturation ** slope + x ** slope)
+
+
+def channel_name(column: str) -> str:
+    """Derive a display name from a spend column, e.g. `tv_spend` -> `tv`."""
+    name = column.lower().replace(SPEND_MARKER, "").strip(" _-")
+    return name or column
+
+
+def duplicate_channels(spend_columns: List[str]) -> List[str]:
+    """Channel names shared by several spend columns, e.g. `tv_spend` and `spend_tv`."""
+    names = [channel_name(c) for c in spend_columns]
+    return sorted({n for n in names if names.count(n) > 1})
+
+
+class FittedModel:
+    """Fitted regression state shared by the decomposition, forecast and simulator endpoints."""
+
+    def __init__(self, dates: np.ndarray, channels: List[str], spend: np.ndarray, columns: List[str],
+                 column_components: List[str], design: np.ndarray, coefficients: np.ndarray,
+                 target: np.ndarray, decay: np.ndarray, half_saturation: np.ndarray,
+                 slope: np.ndarray, last_adstock: np.ndarray, origin: np.datetime64,
+                 feature_config: FeatureConfig, controls: List[str], last_controls: np.ndarray,
+                 sigma: float, covariance: np.ndarray):
+        self.dates = dates
+        self.channels = channels
+        self.spend = spend
+        self.columns = columns
+        self.column_components = column_components
+        self.design = design
+        self.coefficients = coefficients
+        self.target = target
+        self.decay = decay
+        self.half_saturation = half_saturation
+        self.slope = slope
+        self.last_adstock = last_adstock
+        self.origin = origin
+        self.feature_config = feature_config
+        self.controls = controls
+        self.last_controls = last_controls
+        self.sigma = sigma
+        self.covariance = covariance
+        self.decomposition = None
+        self.curves = None
+
+    @property
+    def fitted(self) -> np.ndarray:
+        return self.design @ self.coefficients
+
+
+def read_frame(file_path: str) -> pd.DataFrame:
+    """Read an uploaded CSV with normalised column names."""
+    frame = pd.read_csv(file_path)
+    frame.columns = [str(c).strip().lower() for c in frame.columns]
+    return frame
+
+
+def _media_columns(spend: np.ndarray, decay: np.ndarray, slope: np.ndarray):
+    adstocked = geometric_adstock(spend, decay)
+    half_saturation = np.array([
+        np.median(col[col > 0]) if np.any(col > 0) else 1.0 for col in adstocked.T
+    ])
+    return hill(adstocked, half_saturation, slope), adstocked, half_saturation
+
+
+def _cv_error(design: np.ndarray, target: np.ndarray) -> float:
+    """Rolling-origin CV error; falls back to in-sample error on short histories."""
+    n = len(target)
+    if n < MIN_CV_ROWS:
+        coefficients, *_ = np.linalg.lstsq(design, target, rcond=None)
+        return float(np.mean((design @ coefficients - target) ** 2))
+
+    fold_size = n // (CV_FOLDS + 1)
+    errors = []
+    for fold in range(1, CV_FOLDS + 1):
+        split = fold * fold_size
+        stop = n if fold == CV_FOLDS else split + fold_size
+        coefficients, *_ = np.linalg.lstsq(design[:split], target[:split], rcond=None)
+        errors.append(np.mean((design[split:stop] @ coefficients - target[split:stop]) ** 2))
+    return float(np.mean(errors))
+
+
+def fit_model(frame: pd.DataFrame, config: Optional[FeatureConfig] = None) -> FittedModel:
+    """
+    Fit base, calendar, control and channel contributions on a `date, *spend*, sales` frame.
+
+    Spend columns are carried over with geometric adstock and passed through
+    a Hill curve; every other column with numeric values is a control (and
+    must be fully numeric), while text-only columns and unused target
+    columns (e.g. `revenue` next to `sales`) are ignored. The
+    shared adstock decay is picked from DECAY_CANDIDATES by rolling-origin CV,
+    reusing one cached calendar basis for every candidate and fold.
+    """
+    if DATE_COLUMN not in frame.columns:
+        raise ValueError(f"Missing required column: {DATE_COLUMN}")
+    target_column = next((c for c in TARGET_COLUMNS if c in frame.columns), None)
+    if target_column is None:
+        raise ValueError(f"Missing target column: one of {list(TARGET_COLUMNS)}")
+    spend_columns = [c for c in frame.columns if SPEND_MARKER in c]
+    if not spend_columns:
+        raise ValueError(f"No spend columns found (expected column names containing '{SPEND_MARKER}')")
+    duplicated = duplicate_channels(spend_columns)
+    if duplicated:
+        raise ValueError(f"Several spend columns map to the same channel: {duplicated}")
+    # Text-only columns (e.g. region) are labels and other target names are
+    # alternative outcomes, not controls; both are skipped.
+    control_columns = [
+        c for c in frame.columns if c not in spend_columns and c != DATE_COLUMN and c not in TARGET_COLUMNS
+        and pd.to_numeric(frame[c], errors="coerce").notna().any()
+    ]
+
+    frame = frame.assign(**{DATE_COLUMN: pd.to_datetime(frame[DATE_COLUMN])})
+    frame = frame.sort_values(DATE_COLUMN).reset_index(drop=True)
+    dates = frame[DATE_COLUMN].to_numpy(dtype="datetime64[D]")
+    spend = frame[spend_columns].to_numpy(dtype=np.float64)
+    target = frame[target_column].to_numpy(dtype=np.float64)
+
+    if config is None:
+        # Yearly Fourier terms are unidentifiable with less than a year of history.
+        config = FeatureConfig(fourier_order=FeatureConfig().fourier_order if len(dates) >= MIN_SEASONAL_ROWS else 0)
+    origin = dates[0]
+    basis = calendar_basis(dates, origin, config)
+    controls, control_names = control_matrix(frame, control_columns)
+    base_design = np.hstack([np.ones((len(target), 1)), basis.matrix, controls])
+
+    channels = [channel_name(c) for c in spend_columns]
+    slope = np.full(len(channels), DEFAULT_SLOPE)
+
+    best = None
+    for candidate in DECAY_CANDIDATES:
+        decay = np.full(len(channels), candidate)
+        media, adstocked, half_saturation = _media_columns(spend, decay, slope)
+        design = np.hstack([base_design, media])
+        error = _cv_error(design, target)
+        if best is None or error < best[0]:
+            best = (error, decay, design, adstocked, half_saturation)
+    _, decay, design, adstocked, half_saturation = best
+
+    coefficients, *_ = np.linalg.lstsq(design, target, rcond=None)
+    residuals = target - design @ coefficients
+    variance = float(residuals @ residuals) / max(len(target) - design.shape[1], 1)
+
+    return FittedModel(
+        dates=dates,
+        channels=channels,
+        spend=spend,
+        columns=["intercept"] + basis.columns + control_names + channels,
+        column_components=["base"] + basis.column_components + control_names + channels,
+        design=design,
+        coefficients=coefficients,
+        target=target,
+        decay=decay,
+        half_saturation=half_saturation,
+        slope=slope,
+        last_adstock=adstocked[-1],
+        origin=origin,
+        feature_config=config,
+        controls=control_names,
+        last_controls=controls[-1],
+        sigma=float(np.sqrt(variance)),
+        covariance=variance * np.linalg.pinv(design.T @ design),
+    )
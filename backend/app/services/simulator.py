@@ -0,0 +1,214 @@
+"""
+Simulator Service - Budget what-ifs against precomputed saturation curve state
+"""
+import math
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from app.models.schemas import MMMResult, SimulationResult
+from app.services.model import FittedModel, hill
+from app.services.sample_data import get_sample_data
+
+
+def hill_derivative(x: np.ndarray, half_saturation: np.ndarray, slope: np.ndarray) -> np.ndarray:
+    x = np.maximum(x, 1e-9)
+    hs = half_saturation ** slope
+    return slope * hs * x ** (slope - 1) / (hs + x ** slope) ** 2
+
+
+class CurveState:
+    """
+    Per-channel curve arrays for one result, computed once and reused by every update.
+
+    Budgets are mapped onto each channel's Hill curve input (`spend_scale`);
+    response and marginal ROAS are the curve and its slope times fixed scales,
+    and revenue moves by the change in response from the current budgets.
+    """
+
+    def __init__(self, channels: List[str], spend: np.ndarray, contribution: np.ndarray,
+                 half_saturation: np.ndarray, slope: np.ndarray, spend_scale: np.ndarray,
+                 response_scale: np.ndarray, marginal_scale: np.ndarray, current_revenue: float):
+        self.channels = channels
+        self.index = {name: i for i, name in enumerate(channels)}
+        self.spend = spend
+        self.contribution = contribution
+        self.half_saturation = half_saturation
+        self.slope = slope
+        self.spend_scale = spend_scale
+        self.response_scale = response_scale
+        self.marginal_scale = marginal_scale
+        self.current_revenue = current_revenue
+        self.current_response = self._response(spend)
+
+    @classmethod
+    def from_result(cls, result: MMMResult) -> "CurveState":
+        """
+        Curves from a sample result: the contribution is scaled by
+        hill(s) / hill(current spend) and the reported mROAS by the curve's slope.
+        """
+        curves = {c.channel: c for c in result.saturation_curves}
+        channels = [c.name for c in result.channels]
+        spend = np.array([c.spend for c in result.channels], dtype=np.float64)
+        half_saturation = np.array([curves[c].half_saturation for c in channels])
+        slope = np.array([curves[c].slope for c in channels])
+        contribution = np.array([c.contribution for c in result.channels])
+        mroas = np.array([c.mROAS for c in result.channels])
+        return cls(
+            channels, spend, contribution, half_saturation, slope,
+            spend_scale=np.ones(len(channels)),
+            response_scale=contribution / np.maximum(hill(spend, half_saturation, slope), 1e-12),
+            marginal_scale=mroas / np.maximum(hill_derivative(spend, half_saturation, slope), 1e-12),
+            current_revenue=result.kpis.base_sales + float(contribution.sum()),
+        )
+
+    @classmethod
+    def from_model(cls, model: FittedModel) -> "CurveState":
+        """
+        Curves from a fitted upload, with budgets as total spend over the observed weeks.
+
+        A budget spread evenly over the weeks settles at an adstock of
+        weekly spend / (1 - decay), which goes through the fitted Hill curve;
+        the curve is scaled to the channel's contribution in the decomposition.
+        """
+        weeks = len(model.dates)
+        components = model.decomposition.components
+        contribution = np.array([
+            float(model.decomposition.values[:, components.index(c)].sum()) for c in model.channels
+        ])
+        spend = model.spend.sum(axis=0)
+        spend_scale = 1.0 / (weeks * (1.0 - model.decay))
+        current = hill(spend * spend_scale, model.half_saturation, model.slope)
+        # Anchor each curve on its decomposed contribution; unspent channels fall
+        # back to the steady-state response implied by their coefficient.
+        response_scale = np.where(
+            current > 0, contribution / np.maximum(current, 1e-12),
+            weeks * model.coefficients[-len(model.channels):],
+        )
+        return cls(
+            list(model.channels), spend, contribution,
+            model.half_saturation, model.slope,
+            spend_scale=spend_scale,
+            response_scale=response_scale,
+            marginal_scale=response_scale * spend_scale,
+            current_revenue=float(model.decomposition.values.sum(dtype=np.float64)),
+        )
+
+    def _response(self, budgets: np.ndarray) -> np.ndarray:
+        return self.response_scale * hill(budgets * self.spend_scale, self.half_saturation, self.slope)
+
+    def budgets_dict(self, budgets: np.ndarray) -> Dict[str, float]:
+        return {name: float(b) for name, b in zip(self.channels, budgets)}
+
+    def vector(self, budgets: Dict[str, float], start: Optional[np.ndarray] = None) -> np.ndarray:
+        """Absolute budgets by channel name onto a budget vector (defaults to current spend)."""
+        vector = (self.spend if start is None else start).copy()
+        for name, value in budgets.items():
+            if name not in self.index:
+                raise ValueError(f"Unknown channel: {name}")
+            vector[self.index[name]] = value
+        return np.maximum(vector, 0.0)
+
+    def simulate(self, budgets: np.ndarray):
+        """Return the SimulationResult and per-channel marginal ROAS for a budget vector."""
+        response = self.contribution + self._response(budgets) - self.current_response
+        marginal = self.marginal_scale * hill_derivative(budgets * self.spend_scale, self.half_saturation, self.slope)
+        delta = float((response - self.contribution).sum())
+        projected = self.current_revenue + delta
+        total = float(budgets.sum())
+
+        result = SimulationResult(
+            projected_revenue=round(projected, 2),
+            revenue_vs_current=round(delta, 2),
+            blended_roas=round(float(response.sum()) / total, 4) if total > 0 else 0.0,
+            optimization_score=int(round(max(0.0, min(100.0, 65 + delta / 1000000 * 2)))),
+        )
+        return result, {name: round(float(m), 4) for name, m in zip(self.channels, marginal)}
+
+
+class SimulatorSession:
+    """
+    Budget state for one live simulator connection.
+
+    Incoming messages are merged into a pending change until the next update
+    is computed, so a burst of slider ticks costs a single simulation.
+    """
+
+    def __init__(self, curves: CurveState):
+        self.curves = curves
+        self.budgets = curves.spend.copy()
+        self._pending_budgets: Dict[str, float] = {}
+        self._pending_deltas: Dict[str, float] = {}
+        self.seq: Optional[int] = None
+
+    def submit(self, message: dict):
+        """
+        Coalesce a client message: `budgets` (absolute), `deltas` (relative) or `reset`.
+
+        The whole message is validated before any of it is applied.
+        """
+        if not isinstance(message, dict):
+            raise TypeError("Message must be a JSON object")
+        budgets = self._values(message.get("budgets"))
+        deltas = self._values(message.get("deltas"))
+        if message.get("reset"):
+            self._pending_budgets = self.curves.budgets_dict(self.curves.spend)
+            self._pending_deltas = {}
+        for name, value in budgets.items():
+            self._pending_budgets[name] = value
+            self._pending_deltas.pop(name, None)
+        for name, value in deltas.items():
+            self._pending_deltas[name] = self._pending_deltas.get(name, 0.0) + value
+        if "seq" in message:
+            self.seq = message["seq"]
+
+    def _values(self, values) -> Dict[str, float]:
+        if not values:
+            return {}
+        if not isinstance(values, dict):
+            raise TypeError("budgets and deltas must be objects of channel -> amount")
+        checked = {}
+        for name, value in values.items():
+            if name not in self.curves.index:
+                raise ValueError(f"Unknown channel: {name}")
+            amount = float(value)
+            if not math.isfinite(amount):
+                raise ValueError(f"Amount for {name} must be a finite number")
+            checked[name] = amount
+        return checked
+
+    def update(self) -> dict:
+        """Apply pending changes and simulate the resulting budgets."""
+        budgets = self.curves.vector(self._pending_budgets, start=self.budgets)
+        for name, value in self._pending_deltas.items():
+            budgets[self.curves.index[name]] = max(budgets[self.curves.index[name]] + value, 0.0)
+        self._pending_budgets, self._pending_deltas = {}, {}
+        self.budgets = budgets
+
+        result, marginal = self.curves.simulate(budgets)
+        return {
+            "seq": self.seq,
+            "budgets": self.curves.budgets_dict(budgets),
+            "result": result,
+            "marginal_roas": marginal,
+        }
+
+
+@lru_cache(maxsize=None)
+def _sample_curves(scenario: str) -> CurveState:
+    return CurveState.from_result(get_sample_data(scenario))
+
+
+def load_curves(model: Optional[FittedModel] = None, scenario: Optional[str] = None) -> CurveState:
+    """
+    Curve state for a fitted model (looked up by the caller) or a sample scenario.
+
+    Raises ValueError for a bad scenario or when neither is given.
+    """
+    if model is not None:
+        if model.curves is None:
+            model.curves = CurveState.from_model(model)
+        return model.curves
+    if scenario:
+        return _sample_curves(scenario)
+    raise ValueError("Either model_id or scenario is required")
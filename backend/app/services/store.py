@@ -0,0 +1,37 @@
+"""
+Model Store - In-memory registry of fitted models keyed by model id
+"""
+import threading
+import uuid
+from collections import OrderedDict
+
+from app.services.model import FittedModel
+
+MAX_MODELS = 32
+
+
+class ModelStore:
+    """Keeps the most recently fitted models so follow-up requests can reuse them."""
+
+    def __init__(self, max_models: int = MAX_MODELS):
+        self.max_models = max_models
+        self._models: "OrderedDict[str, FittedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, model: FittedModel) -> str:
+        model_id = uuid.uuid4().hex
+        with self._lock:
+            self._models[model_id] = model
+            while len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+        return model_id
+
+    def get(self, model_id: str) -> FittedModel:
+        """Return a stored model, raising KeyError if it is unknown or evicted."""
+        with self._lock:
+            model = self._models[model_id]
+            self._models.move_to_end(model_id)
+            return model
+
+
+model_store = ModelStore()
@@ -0,0 +1,181 @@
+"""
+Array Transport - Shared-memory handles for passing large NumPy arrays between processes
+
+Posterior draws and design matrices are written once into a shared-memory
+segment; only a small picklable handle crosses the process boundary, and
+workers map the segment zero-copy. Worker results come back the same way.
+
+Segments are tracked by the API process's resource tracker (see
+`worker_pool`), so a result a worker exported but nobody adopted, e.g.
+because the caller failed first, is still unlinked when the API process
+exits; call `discard` to free it earlier.
+"""
+import atexit
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+
+class SharedArrayHandle(NamedTuple):
+    """Picklable reference to an array living in a shared-memory segment."""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64)) * np.dtype(self.dtype).itemsize
+
+
+def _write_segment(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, SharedArrayHandle]:
+    array = np.ascontiguousarray(array)
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+    return segment, SharedArrayHandle(segment.name, tuple(array.shape), array.dtype.str)
+
+
+class SharedArrayRegistry:
+    """
+    Owner-side reference counts for shared segments.
+
+    The segment is unlinked when the last reference is released, so several
+    in-flight tasks can share one copy of the model state.
+    """
+
+    def __init__(self):
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self._refs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def share(self, array: np.ndarray) -> SharedArrayHandle:
+        """Copy `array` into a new segment owned by this process (one reference)."""
+        segment, handle = _write_segment(array)
+        with self._lock:
+            self._segments[handle.name] = segment
+            self._refs[handle.name] = 1
+        return handle
+
+    def adopt(self, handle: SharedArrayHandle) -> SharedArrayHandle:
+        """Take ownership of a segment exported by a worker (one reference)."""
+        segment = shared_memory.SharedMemory(name=handle.name)
+        with self._lock:
+            self._segments[handle.name] = segment
+            self._refs[handle.name] = 1
+        return handle
+
+    def retain(self, handle: SharedArrayHandle) -> SharedArrayHandle:
+        with self._lock:
+            self._refs[handle.name] += 1
+        return handle
+
+    def release(self, handle: SharedArrayHandle):
+        """Drop a reference, unlinking the segment when none remain."""
+        with self._lock:
+            self._refs[handle.name] -= 1
+            if self._refs[handle.name] > 0:
+                return
+            del self._refs[handle.name]
+            segment = self._segments.pop(handle.name)
+        _close(segment)
+        segment.unlink()
+
+    def array(self, handle: SharedArrayHandle) -> np.ndarray:
+        """Zero-copy view of an owned segment; valid until its last release."""
+        with self._lock:
+            segment = self._segments[handle.name]
+        return np.ndarray(handle.shape, dtype=handle.dtype, buffer=segment.buf)
+
+    def release_all(self):
+        """Unlink every owned segment regardless of outstanding references (shutdown)."""
+        with self._lock:
+            segments = list(self._segments.values())
+            self._segments.clear()
+            self._refs.clear()
+        for segment in segments:
+            _close(segment)
+            segment.unlink()
+
+
+def _close(segment: shared_memory.SharedMemory):
+    try:
+        segment.close()
+    except BufferError:
+        pass  # A caller still holds a view; the mapping goes when it is collected
+
+
+@contextmanager
+def attach(handle: SharedArrayHandle) -> Iterator[np.ndarray]:
+    """
+    Map a shared array read-only in a worker without copying.
+
+    Views must not outlive the block; copy or `export` anything that should.
+    """
+    segment = shared_memory.SharedMemory(name=handle.name)
+    array = np.ndarray(handle.shape, dtype=handle.dtype, buffer=segment.buf)
+    array.flags.writeable = False
+    try:
+        yield array
+    finally:
+        del array
+        segment.close()
+
+
+def export(array: np.ndarray) -> SharedArrayHandle:
+    """
+    Publish a worker result as a shared segment and return its handle.
+
+    Ownership passes to the receiving process, which must `adopt` it.
+    """
+    segment, handle = _write_segment(array)
+    segment.close()
+    return handle
+
+
+def discard(handle: SharedArrayHandle):
+    """Unlink an exported result that will not be adopted."""
+    segment = shared_memory.SharedMemory(name=handle.name)
+    segment.close()
+    segment.unlink()
+
+
+def worker_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Process pool whose workers share this process's resource tracker.
+
+    Starting the tracker before workers exist keeps a worker exiting from
+    unlinking segments it attached to or exported; the segments stay tracked
+    until this process unlinks them or exits.
+    """
+    resource_tracker.ensure_running()
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+# Model state a worker needs to simulate or forecast from a FittedModel
+MODEL_ARRAYS = ("design", "coefficients", "covariance", "target",
+                "decay", "half_saturation", "slope", "last_adstock")
+
+
+def share_model(model) -> Dict[str, SharedArrayHandle]:
+    """
+    Share a fitted model's arrays with workers; release each handle when done.
+    """
+    return {name: registry.share(getattr(model, name)) for name in MODEL_ARRAYS}
+
+
+def release_model(handles: Dict[str, SharedArrayHandle]):
+    for handle in handles.values():
+        registry.release(handle)
+
+
+@contextmanager
+def attach_model(handles: Dict[str, SharedArrayHandle]) -> Iterator[Dict[str, np.ndarray]]:
+    """Worker-side read-only, zero-copy views of arrays shared by `share_model`."""
+    with ExitStack() as stack:
+        yield {name: stack.enter_context(attach(handle)) for name, handle in handles.items()}
+
+
+registry = SharedArrayRegistry()
+atexit.register(registry.release_all)
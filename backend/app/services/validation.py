@@ -0,0 +1,318 @@
+"""
+Upload Validation - Single-pass CSV scan producing a profiling report and fit-ready columns
+"""
+import csv
+import hashlib
+import io
+import math
+import time
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+from typing import BinaryIO, List, Optional
+
+from app.services.model import DATE_COLUMN, TARGET_COLUMNS, SPEND_MARKER, MIN_CV_ROWS, channel_name, duplicate_channels
+
+COLLINEARITY_THRESHOLD = 0.9
+ISO_DATE = "iso"
+DATE_FORMATS = (ISO_DATE, "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d")  # Preference order when ambiguous
+
+
+class _HashingReader(io.RawIOBase):
+    """Binary stream wrapper that hashes bytes as they are read, optionally copying them to `sink`."""
+
+    def __init__(self, stream: BinaryIO, sink: Optional[BinaryIO] = None):
+        self._stream = stream
+        self._sink = sink
+        self.sha256 = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self._stream.read(len(buffer))
+        self.sha256.update(chunk)
+        if self._sink is not None:
+            self._sink.write(chunk)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def _parse_date(cell: str, fmt: str) -> Optional[date]:
+    try:
+        if fmt == ISO_DATE:
+            return datetime.fromisoformat(cell).date()
+        return datetime.strptime(cell, fmt).date()
+    except ValueError:
+        return None
+
+
+class _Column:
+    """Per-column accumulator filled cell by cell during the scan."""
+    __slots__ = ("name", "is_date", "values", "missing", "invalid", "example", "date_format", "format_assumed")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.is_date = name == DATE_COLUMN
+        self.values = []
+        self.missing = 0
+        self.invalid = 0
+        self.example = None
+        self.date_format = None
+        self.format_assumed = False
+
+    def _reject(self, cell: str):
+        self.invalid += 1
+        self.values.append(None if self.is_date else np.nan)
+        if self.example is None:
+            self.example = cell
+
+    def add(self, cell: str):
+        cell = cell.strip()
+        if not cell:
+            self.missing += 1
+            self.values.append(None if self.is_date else np.nan)
+            return
+        if not self.is_date:
+            try:
+                value = float(cell.replace(",", ""))
+            except ValueError:
+                value = None
+            if value is None or not math.isfinite(value):
+                self._reject(cell)
+            else:
+                self.values.append(value)
+            return
+
+        if self.date_format is None:
+            # One format per column, fixed by the first cell only one format can parse
+            # (e.g. 15/01/2024); ambiguous cells before it are kept raw until then.
+            matches = [fmt for fmt in DATE_FORMATS if _parse_date(cell, fmt)]
+            if len(matches) > 1:
+                self.values.append(cell)
+                return
+            if not matches:
+                self._reject(cell)
+                return
+            self.date_format = matches[0]
+        parsed = _parse_date(cell, self.date_format)
+        if parsed is None:
+            self._reject(cell)
+        else:
+            self.values.append(parsed)
+
+    def finish(self):
+        """Resolve date cells held back while the column's format was still ambiguous."""
+        if not self.is_date:
+            return
+        pending = [v for v in self.values if isinstance(v, str)]
+        if not pending:
+            return
+        if self.date_format is None:
+            self.date_format = next(fmt for fmt in DATE_FORMATS if _parse_date(pending[0], fmt))
+            self.format_assumed = True
+        values, self.values = self.values, []
+        for value in values:
+            if isinstance(value, str):
+                parsed = _parse_date(value, self.date_format)
+                if parsed is None:
+                    self._reject(value)
+                else:
+                    self.values.append(parsed)
+            else:
+                self.values.append(value)
+
+
+class CsvScan:
+    """Result of one pass over an upload: the profiling report plus parsed columns."""
+
+    def __init__(self, upload_id: str, filename: str, report: dict, columns: dict):
+        self.upload_id = upload_id
+        self.filename = filename
+        self.report = report
+        self.columns = columns
+
+    @property
+    def valid(self) -> bool:
+        return self.report["valid"]
+
+    @property
+    def errors(self) -> List[str]:
+        return [i["message"] for i in self.report["issues"] if i["severity"] == "error"]
+
+    def frame(self) -> pd.DataFrame:
+        """The parsed columns as a DataFrame ready for `fit_model`, without re-reading the file."""
+        return pd.DataFrame(self.columns)
+
+
+def scan_csv(stream: BinaryIO, filename: str = "", sink: Optional[BinaryIO] = None) -> CsvScan:
+    """
+    Profile an uploaded CSV in a single streaming pass.
+
+    Checks column types, duplicated and missing weeks, negative spend and
+    collinear regressors, and keeps the parsed columns so a subsequent fit
+    does not have to parse the file again. Bytes are copied to `sink`, if
+    given, as they are read.
+    """
+    started = time.perf_counter()
+    reader = _HashingReader(stream, sink)
+    rows = csv.reader(io.TextIOWrapper(io.BufferedReader(reader), encoding="utf-8-sig", newline=""))
+
+    columns = []
+    row_count = ragged = 0
+    read_error = None
+    try:
+        header = next(rows, None) or []
+        columns = [_Column(h.strip().lower()) for h in header]
+        for row in rows:
+            if not any(cell.strip() for cell in row):
+                continue
+            row_count += 1
+            if len(row) != len(columns):
+                ragged += 1
+                row = (row + [""] * len(columns))[:len(columns)]
+            for column, cell in zip(columns, row):
+                column.add(cell)
+    except UnicodeDecodeError as e:
+        read_error = f"File is not UTF-8 text (invalid byte {e.object[e.start:e.start + 1]!r}); re-save it as UTF-8 CSV"
+    except csv.Error as e:
+        read_error = f"Malformed CSV at line {rows.line_num}: {e}"
+    if read_error:
+        # A partial read is not profiled; finish hashing so upload_id still identifies the file.
+        columns, row_count, ragged = [], 0, 0
+        while reader.read(1 << 20):
+            pass
+
+    for column in columns:
+        column.finish()
+
+    issues = []
+
+    def issue(severity: str, message: str):
+        issues.append({"severity": severity, "message": message})
+
+    names = [c.name for c in columns]
+    by_name = {c.name: c for c in columns}
+    target = next((c for c in TARGET_COLUMNS if c in by_name), None)
+    spend_names = [n for n in names if SPEND_MARKER in n]
+
+    if read_error:
+        issue("error", read_error)
+    elif not columns:
+        issue("error", "File is empty")
+    else:
+        if DATE_COLUMN not in by_name:
+            issue("error", f"Missing required column: {DATE_COLUMN}")
+        if target is None:
+            issue("error", f"Missing target column: one of {list(TARGET_COLUMNS)}")
+        if not spend_names:
+            issue("error", f"No spend columns found (expected column names containing '{SPEND_MARKER}')")
+        duplicated = sorted({n for n in names if names.count(n) > 1})
+        if duplicated:
+            issue("error", f"Duplicate column names (after lower-casing): {duplicated}")
+        duplicated = duplicate_channels(spend_names)
+        if duplicated:
+            issue("error", f"Several spend columns map to the same channel: {duplicated}")
+    if ragged:
+        issue("warning", f"{ragged} rows have a different number of fields than the header")
+    if columns and row_count < MIN_CV_ROWS:
+        issue("warning", f"Only {row_count} rows; at least {MIN_CV_ROWS} weeks are needed for cross-validated fits")
+
+    date_column = next((c for c in columns if c.is_date), None)
+    if date_column is not None and date_column.format_assumed:
+        issue("warning", f"Every date is ambiguous between day/month orders; assumed {date_column.date_format}")
+
+    profiles = []
+    for column in columns:
+        text = not column.is_date and column.invalid > 0 and column.invalid == row_count - column.missing
+        kind = ("date" if column.is_date else "target" if column.name == target
+                else "spend" if column.name in spend_names
+                else "ignored" if text or column.name in TARGET_COLUMNS else "control")
+        dtype = "date" if column.is_date else "text" if text else "numeric"
+        negative = 0 if column.is_date else int(np.sum(np.asarray(column.values) < 0))
+        profiles.append({
+            "name": column.name, "kind": kind, "dtype": dtype,
+            "missing": column.missing, "invalid": column.invalid, "negative": negative,
+        })
+        if kind == "ignored":
+            if column.name in TARGET_COLUMNS:
+                issue("warning", f"Column '{column.name}' is not used; '{target}' is the target")
+            continue
+        if column.invalid:
+            expected = "dates" if column.is_date else "numbers"
+            issue("error", f"Column '{column.name}' has {column.invalid} values that are not {expected} (e.g. '{column.example}')")
+        if column.missing:
+            issue("error", f"Column '{column.name}' has {column.missing} missing values")
+        if kind == "spend" and negative:
+            issue("error", f"Column '{column.name}' has {negative} negative spend values")
+
+    report = {
+        "upload_id": reader.sha256.hexdigest(),
+        "filename": filename,
+        "row_count": row_count,
+        "columns": profiles,
+        "start_date": None,
+        "end_date": None,
+        "duplicate_dates": [],
+        "date_gaps": [],
+        "spend": [],
+        "collinearity": [],
+    }
+
+    parsed = {}
+    if DATE_COLUMN in by_name:
+        dates = np.array([d or np.datetime64("NaT") for d in by_name[DATE_COLUMN].values], dtype="datetime64[D]")
+        parsed[DATE_COLUMN] = dates
+        valid_dates = np.sort(dates[~np.isnat(dates)])
+        if len(valid_dates):
+            report["start_date"], report["end_date"] = str(valid_dates[0]), str(valid_dates[-1])
+            steps = np.diff(valid_dates).astype(int)
+            duplicates = np.unique(valid_dates[1:][steps == 0])
+            report["duplicate_dates"] = [str(d) for d in duplicates]
+            if len(duplicates):
+                issue("error", f"{len(duplicates)} dates appear more than once")
+            missing_weeks = np.rint(steps / 7).astype(int) - 1
+            for i in np.flatnonzero(missing_weeks >= 1):
+                report["date_gaps"].append({
+                    "after": str(valid_dates[i]),
+                    "before": str(valid_dates[i + 1]),
+                    "missing_weeks": int(missing_weeks[i]),
+                })
+            if report["date_gaps"]:
+                missing = sum(g["missing_weeks"] for g in report["date_gaps"])
+                issue("warning", f"{missing} weeks missing across {len(report['date_gaps'])} gaps")
+            off_weekly = int(np.sum((steps > 0) & (steps % 7 != 0)))
+            if off_weekly:
+                issue("error", f"{off_weekly} date steps are not whole weeks; the model expects weekly data")
+
+    for column, profile in zip(columns, profiles):
+        if not column.is_date and profile["kind"] != "ignored":
+            parsed[column.name] = np.asarray(column.values, dtype=np.float64)
+
+    for name in spend_names:
+        values = parsed[name][~np.isnan(parsed[name])]
+        if len(values):
+            report["spend"].append({
+                "channel": channel_name(name), "column": name,
+                "total": round(float(values.sum()), 2), "mean": round(float(values.mean()), 2),
+                "min": round(float(values.min()), 2), "max": round(float(values.max()), 2),
+                "zero_weeks": int(np.sum(values == 0)),
+            })
+
+    regressors = [n for n in names if n in parsed and n not in (DATE_COLUMN, target)
+                  and not np.isnan(parsed[n]).any() and np.std(parsed[n]) > 0]
+    if len(regressors) > 1 and row_count > 2:
+        correlation = np.corrcoef(np.vstack([parsed[n] for n in regressors]))
+        for i, j in zip(*np.triu_indices(len(regressors), k=1)):
+            if abs(correlation[i, j]) >= COLLINEARITY_THRESHOLD:
+                report["collinearity"].append({
+                    "a": regressors[i], "b": regressors[j], "correlation": round(float(correlation[i, j]), 3),
+                })
+        if report["collinearity"]:
+            issue("warning", f"{len(report['collinearity'])} pairs of columns are highly correlated; "
+                             "their contributions cannot be separated reliably")
+
+    report["issues"] = issues
+    report["valid"] = not any(i["severity"] == "error" for i in issues)
+    report["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return CsvScan(report["upload_id"], filename, report, parsed)
@@ -0,0 +1,267 @@
+"""
+Load Test - Mixed upload / sample-data / simulation traffic with a latency SLO report
+
+Drives `main:app` in-process (default) or a running server (`--url`) with
+open-loop traffic at fixed per-endpoint rates, and writes a JSON report with
+throughput, p50/p95/p99 latency and error rate per endpoint plus RSS and
+in-flight requests over time. Requires httpx.
+
+    cd backend && python -m benchmarks.loadtest --duration 30 --report before.json
+    cd backend && python -m benchmarks.loadtest --url http://127.0.0.1:8001 --server-pid 1234
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import numpy as np
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    sys.exit("The load test requires httpx: pip install httpx")
+
+SCENARIOS = ("high", "mid", "low")
+SAMPLE_CHANNELS = ["Linear TV", "Meta (FB/IG)", "TikTok", "YouTube"]
+DEFAULT_RATES = {"upload": 0.5, "sample": 5.0, "simulate": 20.0, "health": 2.0}
+
+
+def synthetic_csv(rows: int, channels: int, seed: int) -> bytes:
+    """Weekly `date, <channel>_spend..., price, sales` CSV with adstocked media effects."""
+    rng = np.random.default_rng(seed)
+    dates = np.datetime64("2021-01-04") + np.arange(rows) * np.timedelta64(7, "D")
+    spend = rng.gamma(2.0, 20000.0, size=(rows, channels)).round(2)
+    price = rng.uniform(9.0, 11.0, size=rows).round(2)
+    weeks = np.arange(rows)
+    sales = (1e6 + 8e4 * np.sin(2 * np.pi * weeks / 52.18) - 2e4 * price
+             + np.sqrt(spend).sum(axis=1) * 300 + rng.normal(0, 2e4, rows)).round(2)
+
+    header = ",".join(["date"] + [f"ch{i}_spend" for i in range(channels)] + ["price", "sales"])
+    lines = [header] + [
+        ",".join([str(d)] + [f"{v:.2f}" for v in row] + [f"{p:.2f}", f"{s:.2f}"])
+        for d, row, p, s in zip(dates, spend, price, sales)
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def rss_mb(pid: Optional[int]) -> Optional[float]:
+    """Current resident set size of `pid` in MB, or None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, rates: Dict[str, float], duration: float,
+                 csvs: List[bytes], rows: int, channels: int, max_in_flight: int,
+                 sample_interval: float, server_pid: Optional[int]):
+        self.client = client
+        self.rates = rates
+        self.duration = duration
+        self.csvs = csvs
+        self.upload_channels = [f"ch{i}" for i in range(channels)]
+        self.upload_spend = 40000.0 * rows  # Mean total spend per synthetic channel
+        self.max_in_flight = max_in_flight
+        self.sample_interval = sample_interval
+        self.server_pid = server_pid
+        self.latencies: Dict[str, List[float]] = {kind: [] for kind in rates}
+        self.errors: Dict[str, int] = {kind: 0 for kind in rates}
+        self.dropped: Dict[str, int] = {kind: 0 for kind in rates}
+        self.timeline: List[dict] = []
+        self.model_ids: List[str] = []
+        self.in_flight = 0
+
+    async def upload(self):
+        csv = random.choice(self.csvs)
+        response = await self.client.post("/api/upload", files={"file": ("loadtest.csv", csv, "text/csv")})
+        if response.status_code == 200:
+            self.model_ids = (self.model_ids + [response.json()["model_id"]])[-8:]
+        return response
+
+    async def sample(self):
+        return await self.client.get(f"/api/sample-data/{random.choice(SCENARIOS)}")
+
+    async def simulate(self):
+        # Rescale two channels of an uploaded model (synthetic `chN` channels) or a sample scenario.
+        if self.model_ids and random.random() < 0.5:
+            target = {"model_id": random.choice(self.model_ids)}
+            channels, spend = self.upload_channels, self.upload_spend
+        else:
+            target = {"scenario": random.choice(SCENARIOS)}
+            channels, spend = SAMPLE_CHANNELS, 1e7
+        budgets = {name: spend * random.uniform(0.5, 1.5) for name in random.sample(channels, 2)}
+        return await self.client.post("/api/simulate", json={**target, "budgets": budgets})
+
+    async def health(self):
+        return await self.client.get("/health")
+
+    async def _timed(self, kind: str):
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            response = await getattr(self, kind)()
+            ok = response.status_code < 400
+        except Exception:  # Transport failures and anything else still count, with their latency
+            ok = False
+        finally:
+            self.in_flight -= 1
+        self.latencies[kind].append(time.perf_counter() - started)
+        if not ok:
+            self.errors[kind] += 1
+
+    async def _drive(self, kind: str, rate: float, tasks: set):
+        """Open-loop arrivals: fire on schedule regardless of how earlier requests fare."""
+        interval = 1.0 / rate
+        next_at = time.perf_counter() + random.uniform(0, interval)
+        end = self.started + self.duration
+        while next_at < end:
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+            if self.in_flight >= self.max_in_flight:
+                self.dropped[kind] += 1
+            else:
+                task = asyncio.create_task(self._timed(kind))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            next_at += interval
+
+    async def _sample_resources(self):
+        while True:
+            self.timeline.append({
+                "t": round(time.perf_counter() - self.started, 2),
+                "rss_mb": rss_mb(self.server_pid),
+                "in_flight": self.in_flight,
+                "completed": sum(len(v) for v in self.latencies.values()),
+            })
+            await asyncio.sleep(self.sample_interval)
+
+    async def run(self) -> dict:
+        tasks: set = set()
+        self.started = time.perf_counter()
+        sampler = asyncio.create_task(self._sample_resources())
+        await asyncio.gather(*(self._drive(kind, rate, tasks) for kind, rate in self.rates.items() if rate > 0))
+        if tasks:
+            await asyncio.wait(set(tasks))
+        elapsed = time.perf_counter() - self.started
+        sampler.cancel()
+        self.timeline.append({
+            "t": round(elapsed, 2), "rss_mb": rss_mb(self.server_pid),
+            "in_flight": self.in_flight, "completed": sum(len(v) for v in self.latencies.values()),
+        })
+
+        endpoints = {}
+        for kind, latencies in self.latencies.items():
+            ms = np.array(latencies) * 1000
+            endpoints[kind] = {
+                "target_rps": self.rates[kind],
+                "requests": len(latencies),
+                "throughput_rps": round(len(latencies) / elapsed, 2),
+                "errors": self.errors[kind],
+                "error_rate": round(self.errors[kind] / len(latencies), 4) if len(latencies) else 0.0,
+                "dropped": self.dropped[kind],
+                "p50_ms": round(float(np.percentile(ms, 50)), 2) if len(ms) else None,
+                "p95_ms": round(float(np.percentile(ms, 95)), 2) if len(ms) else None,
+                "p99_ms": round(float(np.percentile(ms, 99)), 2) if len(ms) else None,
+                "max_ms": round(float(ms.max()), 2) if len(ms) else None,
+            }
+        total = sum(e["requests"] for e in endpoints.values())
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "total_requests": total,
+            "throughput_rps": round(total / elapsed, 2),
+            "error_rate": round(sum(self.errors.values()) / total, 4) if total else 0.0,
+            "endpoints": endpoints,
+            "timeline": self.timeline,
+        }
+
+
+def _client(url: Optional[str]) -> httpx.AsyncClient:
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=60.0)
+    from main import app
+    # Surface app exceptions as 500 responses, as a real server would, so they count as errors.
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60.0)
+
+
+async def run(args) -> dict:
+    # In-process runs measure this process; a remote server only if its pid is given.
+    server_pid = args.server_pid if args.url else os.getpid()
+    rates = dict(DEFAULT_RATES)
+    for item in args.rate or []:
+        kind, _, value = item.partition("=")
+        if kind not in rates:
+            raise SystemExit(f"Unknown traffic kind '{kind}'; expected one of {list(rates)}")
+        rates[kind] = float(value)
+
+    random.seed(args.seed)
+    csvs = [synthetic_csv(args.rows, args.channels, args.seed + i) for i in range(args.csv_variants)]
+    async with _client(args.url) as client:
+        test = LoadTest(client, rates, args.duration, csvs, args.rows, args.channels, args.max_in_flight,
+                        args.sample_interval, server_pid)
+        results = await test.run()
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "target": args.url or "in-process main:app",
+        "python": platform.python_version(),
+        "config": {
+            "duration_s": args.duration, "rates_rps": rates, "rows": args.rows,
+            "channels": args.channels, "max_in_flight": args.max_in_flight, "seed": args.seed,
+        },
+        **results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server; omit to drive main:app in-process")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of traffic")
+    parser.add_argument("--rate", action="append", metavar="KIND=RPS",
+                        help=f"Override a request rate, e.g. --rate simulate=50 (defaults: {DEFAULT_RATES})")
+    parser.add_argument("--rows", type=int, default=104, help="Weeks per synthetic CSV")
+    parser.add_argument("--channels", type=int, default=8, help="Spend channels per synthetic CSV")
+    parser.add_argument("--csv-variants", type=int, default=4, help="Distinct synthetic CSVs to rotate through")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="Arrivals beyond this are counted as dropped")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Seconds between RSS samples")
+    parser.add_argument("--server-pid", type=int,
+                        help="Server process to sample RSS from when using --url (RSS is null without it)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    for kind, stats in report["endpoints"].items():
+        print(f"{kind:>9}: {stats['throughput_rps']:>7} rps  p50 {stats['p50_ms']} ms  "
+              f"p95 {stats['p95_ms']} ms  p99 {stats['p99_ms']} ms  errors {stats['error_rate']:.2%}",
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
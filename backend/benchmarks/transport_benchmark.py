@@ -0,0 +1,100 @@
+"""
+Transport Benchmark - Shared-memory handles vs pickled arrays between processes
+
+Each round trip sends a weeks x channels x geos float64 array to a worker,
+which scales it and sends a same-sized result back.
+
+    cd backend && python -m benchmarks.transport_benchmark --sizes 10 100 1000
+
+A method whose worker dies (typically out of memory) is reported as null.
+"""
+import argparse
+import json
+import statistics
+import time
+import numpy as np
+from concurrent.futures.process import BrokenProcessPool
+
+from app.services.transport import attach, export, registry, worker_pool
+
+CHANNELS = 20
+GEOS = 50
+
+
+def _pickled_task(array: np.ndarray) -> np.ndarray:
+    return array * 2.0
+
+
+def _shared_task(handle):
+    with attach(handle) as array:
+        return export(array * 2.0)
+
+
+def _make_array(megabytes: int) -> np.ndarray:
+    weeks = max(1, megabytes * 2 ** 20 // (8 * CHANNELS * GEOS))
+    return np.random.default_rng(0).random((weeks, CHANNELS, GEOS))
+
+
+def _time_pickled(pool, array: np.ndarray) -> float:
+    started = time.perf_counter()
+    pool.submit(_pickled_task, array).result()
+    return time.perf_counter() - started
+
+
+def _time_shared(pool, array: np.ndarray) -> float:
+    started = time.perf_counter()
+    handle = registry.share(array)
+    result = registry.adopt(pool.submit(_shared_task, handle).result())
+    elapsed = time.perf_counter() - started
+    registry.release(handle)
+    registry.release(result)
+    return elapsed
+
+
+def _median_time(timer, array: np.ndarray, repeats: int):
+    """Median round trip in a fresh single-worker pool; None if the worker dies (e.g. OOM)."""
+    try:
+        with worker_pool(max_workers=1) as pool:
+            pool.submit(int).result()  # Start the worker outside the timings
+            return round(statistics.median(timer(pool, array) for _ in range(repeats)), 4)
+    except BrokenProcessPool:
+        return None
+
+
+def _seconds(value) -> str:
+    return "failed" if value is None else f"{value:.4f}s"
+
+
+def run(sizes, repeats: int) -> list:
+    results = []
+    for megabytes in sizes:
+        array = _make_array(megabytes)
+        row = {
+            "size_mb": round(array.nbytes / 2 ** 20, 1),
+            "pickle_s": _median_time(_time_pickled, array, repeats),
+            "shared_memory_s": _median_time(_time_shared, array, repeats),
+        }
+        del array
+        row["speedup"] = (round(row["pickle_s"] / row["shared_memory_s"], 2)
+                          if row["pickle_s"] and row["shared_memory_s"] else None)
+        results.append(row)
+        print(f"{row['size_mb']:>8} MB  pickle {_seconds(row['pickle_s'])}  "
+              f"shared {_seconds(row['shared_memory_s'])}  speedup {row['speedup'] or '-'}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Array sizes in MB")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeats)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import upload
+from app.routers import upload, decomposition, forecast, simulator
 
 app = FastAPI(title="Meridian MMM App")
 
@@ -21,6 +21,9 @@ app.add_middleware(
 )
 
 app.include_router(upload.router, prefix="/api")
+app.include_router(decomposition.router, prefix="/api")
+app.include_router(forecast.router, prefix="/api")
+app.include_router(simulator.router, prefix="/api")
 
 @app.get("/")
 def read_root():
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import timedelta
+
+from app.services.forecast import forecast
+from app.services.model import fit_model
+
+
+@pytest.fixture
+def model():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2020-01-06", periods=60, freq="W-MON")
+    frame = pd.DataFrame({
+        "date": dates,
+        "tv_spend": rng.uniform(0, 1e5, 60),
+        "sales": rng.uniform(1e6, 2e6, 60),
+    })
+    return fit_model(frame)
+
+
+def _first_week_media(model, start=None) -> float:
+    result = forecast(model, ["tv"], np.zeros((1, 1)), start=start, draws=50)
+    return result["weeks"][0]["media_contribution"]
+
+
+def _last_date(model):
+    return pd.Timestamp(model.dates[-1]).date()
+
+
+@pytest.mark.parametrize("days", [-7, 0, 1, 6])
+def test_rejects_start_within_a_week_of_history(model, days):
+    with pytest.raises(ValueError, match="start_date"):
+        forecast(model, ["tv"], np.zeros((1, 1)), start=_last_date(model) + timedelta(days=days))
+
+
+@pytest.mark.parametrize("decay", [0.0, 0.5])
+def test_off_grid_start_decays_carry_over(model, decay):
+    model.decay = np.array([decay])
+    default = _first_week_media(model)
+    off_grid = _first_week_media(model, _last_date(model) + timedelta(days=10))
+    later = _first_week_media(model, _last_date(model) + timedelta(days=21))
+
+    assert np.isfinite([default, off_grid, later]).all()
+    assert abs(default) >= abs(off_grid) >= abs(later)
+
+
+def test_carry_over_continues_into_default_start(model):
+    model.decay = np.array([0.5])
+    assert abs(_first_week_media(model)) > abs(_first_week_media(model, _last_date(model) + timedelta(days=70)))
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.model import fit_model
+
+
+def _frame(weeks: int = 30, **columns) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "date": pd.date_range("2023-01-02", periods=weeks, freq="W-MON"),
+        "tv_spend": rng.uniform(0, 1e4, weeks),
+        "search_spend": rng.uniform(0, 5e3, weeks),
+        "sales": rng.uniform(1e5, 2e5, weeks),
+    })
+    for name, values in columns.items():
+        frame[name] = values
+    return frame
+
+
+def test_spend_columns_become_channels():
+    model = fit_model(_frame())
+
+    assert model.channels == ["tv", "search"]
+    assert model.controls == []
+    assert model.spend.shape == (30, 2)
+
+
+def test_numeric_extra_columns_become_controls():
+    model = fit_model(_frame(price=np.linspace(9, 11, 30)))
+
+    assert model.controls == ["price"]
+    assert "price" in model.column_components
+
+
+def test_text_only_columns_are_skipped():
+    model = fit_model(_frame(region="north"))
+
+    assert model.controls == []
+
+
+def test_partially_numeric_control_is_rejected():
+    with pytest.raises(ValueError, match="price"):
+        fit_model(_frame(price=["9.5"] * 29 + ["n/a"]))
+
+
+def test_unused_target_column_is_not_a_control():
+    frame = _frame()
+    frame["revenue"] = frame["sales"] * 1.1
+
+    model = fit_model(frame)
+
+    assert model.controls == []
+    np.testing.assert_allclose(model.target, frame.sort_values("date")["sales"].to_numpy())
+
+
+def test_missing_target_is_rejected():
+    with pytest.raises(ValueError, match="target"):
+        fit_model(_frame().drop(columns="sales"))
+
+
+def test_spend_columns_mapping_to_one_channel_are_rejected():
+    frame = _frame()
+    frame["spend_tv"] = frame["tv_spend"]
+
+    with pytest.raises(ValueError, match="tv"):
+        fit_model(frame)
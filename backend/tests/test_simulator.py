@@ -0,0 +1,86 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.simulator import SimulatorSession, load_curves
+from main import app
+
+
+def _session() -> SimulatorSession:
+    return SimulatorSession(load_curves(scenario="high"))
+
+
+@pytest.mark.parametrize("amount", ["nan", "inf", "-inf"])
+def test_submit_rejects_non_finite_amounts(amount):
+    session = _session()
+
+    with pytest.raises(ValueError, match="finite"):
+        session.submit({"budgets": {"TikTok": float(amount)}})
+
+
+def test_submit_rejects_unknown_channel():
+    with pytest.raises(ValueError, match="Unknown channel"):
+        _session().submit({"deltas": {"Radio": 100.0}})
+
+
+def test_submit_rejects_non_object_messages():
+    session = _session()
+
+    with pytest.raises(TypeError):
+        session.submit([1, 2])
+    with pytest.raises(TypeError):
+        session.submit({"budgets": [1, 2]})
+
+
+def test_invalid_message_is_not_partially_applied():
+    session = _session()
+    before = session.budgets.copy()
+
+    with pytest.raises(ValueError):
+        session.submit({"budgets": {"TikTok": 1.0}, "deltas": {"Radio": 1.0}, "seq": 9})
+
+    update = session.update()
+    assert update["seq"] is None
+    assert (session.budgets == before).all()
+
+
+def test_deltas_coalesce_until_update():
+    session = _session()
+    start = session.curves.budgets_dict(session.budgets)["TikTok"]
+
+    session.submit({"deltas": {"TikTok": 100.0}, "seq": 1})
+    session.submit({"deltas": {"TikTok": 50.0}, "seq": 2})
+    update = session.update()
+
+    assert update["seq"] == 2
+    assert update["budgets"]["TikTok"] == pytest.approx(start + 150.0)
+
+
+def test_budget_overrides_earlier_delta_and_reset_restores_spend():
+    session = _session()
+    start = session.curves.budgets_dict(session.budgets)
+
+    session.submit({"deltas": {"TikTok": 100.0}})
+    session.submit({"budgets": {"TikTok": 10.0}})
+    assert session.update()["budgets"]["TikTok"] == pytest.approx(10.0)
+
+    session.submit({"reset": True})
+    assert session.update()["budgets"] == pytest.approx(start)
+
+
+def test_unknown_model_is_404_and_bad_scenario_is_400():
+    client = TestClient(app)
+
+    assert client.post("/api/simulate", json={"model_id": "missing", "budgets": {}}).status_code == 404
+    assert client.post("/api/simulate", json={"scenario": "bogus", "budgets": {}}).status_code == 400
+
+
+def test_socket_answers_binary_frames_with_an_error():
+    client = TestClient(app)
+
+    with client.websocket_connect("/api/ws/simulator?scenario=high") as websocket:
+        websocket.receive_json()
+        websocket.send_bytes(b"\x00")
+        assert "error" in websocket.receive_json()
+
+        websocket.send_json({"deltas": {"TikTok": 1.0}, "seq": 3})
+        assert websocket.receive_json()["seq"] == 3
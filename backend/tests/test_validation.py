@@ -0,0 +1,106 @@
+import hashlib
+import io
+import pytest
+
+from app.services.validation import scan_csv
+
+
+def _scan(text: str, encoding: str = "utf-8"):
+    return scan_csv(io.BytesIO(text.encode(encoding)), "test.csv")
+
+
+def _weekly(rows, header="date,tv_spend,sales"):
+    return header + "\n" + "".join(f"{row}\n" for row in rows)
+
+
+def _errors(scan):
+    return " | ".join(scan.errors)
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf", "NaN"])
+def test_non_finite_numbers_are_invalid(value):
+    scan = _scan(_weekly(["2024-01-01,10,100", f"2024-01-08,{value},110"]))
+
+    assert not scan.valid
+    assert "tv_spend" in _errors(scan)
+    profile = next(c for c in scan.report["columns"] if c["name"] == "tv_spend")
+    assert profile["invalid"] == 1
+
+
+def test_unused_target_column_is_ignored():
+    scan = _scan(_weekly(["2024-01-01,10,100,110", "2024-01-08,12,105,115"],
+                         header="date,tv_spend,sales,revenue"))
+
+    kinds = {c["name"]: c["kind"] for c in scan.report["columns"]}
+    assert kinds["sales"] == "target"
+    assert kinds["revenue"] == "ignored"
+    assert "revenue" not in scan.frame().columns
+
+
+def test_missing_weeks_are_reported_as_gaps():
+    scan = _scan(_weekly(["2024-01-01,10,100", "2024-01-08,10,100", "2024-01-29,10,100"]))
+
+    assert scan.valid
+    assert scan.report["date_gaps"] == [{"after": "2024-01-08", "before": "2024-01-29", "missing_weeks": 2}]
+
+
+def test_off_weekly_cadence_is_an_error_not_a_gap():
+    rows = [f"2024-01-{day:02d},10,100" for day in (1, 9, 17, 25)]
+    scan = _scan(_weekly(rows))
+
+    assert not scan.valid
+    assert scan.report["date_gaps"] == []
+    assert "whole weeks" in _errors(scan)
+
+
+def test_duplicate_dates_are_an_error():
+    scan = _scan(_weekly(["2024-01-01,10,100", "2024-01-01,11,101"]))
+
+    assert not scan.valid
+    assert scan.report["duplicate_dates"] == ["2024-01-01"]
+
+
+def test_duplicate_headers_are_an_error():
+    scan = _scan(_weekly(["2024-01-01,10,11,100"], header="date,tv_spend,TV_Spend,sales"))
+
+    assert not scan.valid
+    assert "Duplicate column names" in _errors(scan)
+
+
+def test_spend_columns_mapping_to_one_channel_are_an_error():
+    scan = _scan(_weekly(["2024-01-01,10,11,100"], header="date,tv_spend,spend_tv,sales"))
+
+    assert not scan.valid
+    assert "same channel" in _errors(scan)
+
+
+@pytest.mark.parametrize("data", [b"date,tv_spend,sales\n2024-01-01,10,100\n", b"date,sales\n\xff\xfe,1\n"])
+def test_sink_receives_every_byte_and_upload_id_hashes_them(data):
+    sink = io.BytesIO()
+    scan = scan_csv(io.BytesIO(data), "test.csv", sink=sink)
+
+    assert sink.getvalue() == data
+    assert scan.upload_id == hashlib.sha256(data).hexdigest()
+
+
+def test_day_first_dates_are_parsed_day_first():
+    scan = _scan(_weekly(["01/01/2024,10,100", "08/01/2024,10,100", "15/01/2024,10,100"]))
+
+    assert scan.valid
+    assert [d.strftime("%Y-%m-%d") for d in scan.frame()["date"]] == ["2024-01-01", "2024-01-08", "2024-01-15"]
+    assert not any("ambiguous" in i["message"] for i in scan.report["issues"])
+
+
+def test_mixed_day_month_orders_are_invalid():
+    scan = _scan(_weekly(["01/01/2024,10,100", "01/15/2024,10,100", "22/01/2024,10,100"]))
+
+    assert not scan.valid
+    assert "22/01/2024" in _errors(scan)
+
+
+def test_fully_ambiguous_dates_warn_about_the_assumed_order():
+    scan = _scan(_weekly(["01/02/2024,10,100", "01/09/2024,10,100"]))
+
+    assert scan.valid
+    assert any("ambiguous" in i["message"] for i in scan.report["issues"])
+    assert [d.strftime("%Y-%m-%d") for d in scan.frame()["date"]] == ["2024-01-02", "2024-01-09"]
@@ -15,6 +15,41 @@ export const uploadFile = async (file) => {
     return response.data;
 };
 
+export const validateFile = async (file) => {
+    const formData = new FormData();
+    formData.append('file', file);
+    const response = await api.post('/validate', formData, {
+        headers: {
+            'Content-Type': 'multipart/form-data',
+        },
+    });
+    return response.data;
+};
+
+export const fetchDecomposition = async (modelId, { from, to, resolution } = {}) => {
+    const response = await api.get(`/decomposition/${modelId}`, {
+        params: { from, to, resolution },
+    });
+    return response.data;
+};
+
+export const fetchForecast = async (plan) => {
+    const response = await api.post('/forecast', plan);
+    return response.data;
+};
+
+// Live simulator: pass { modelId } or { scenario }, then send
+// { deltas: {...}, seq } messages; updates arrive via onUpdate.
+export const openSimulatorSocket = ({ modelId, scenario }, onUpdate) => {
+    const url = new URL(`${api.defaults.baseURL}/ws/simulator`);
+    url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:';
+    if (modelId) url.searchParams.set('model_id', modelId);
+    if (scenario) url.searchParams.set('scenario', scenario);
+    const socket = new WebSocket(url);
+    socket.onmessage = (event) => onUpdate(JSON.parse(event.data));
+    return socket;
+};
+
 export const loadSampleData = async (scenario) => {
     // Use embedded sample data (no backend required)
     const { getSampleData } = await import('./data/sampleData');